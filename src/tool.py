@@ -221,9 +221,7 @@ class CopickTool(ToolInstance):
         # Close all the particles if it's a different run
         if close_all:
             self.close_all()
-            self._mw._picks_table.set_view(tomo.voxel_spacing.run)
-            self._mw._meshes_table.set_view(tomo.voxel_spacing.run)
-            self._mw._segmentations_table.set_view(tomo.voxel_spacing.run)
+            self._mw.set_view(tomo.voxel_spacing.run)
 
         # Open the new volume
         self.load_tomo(tomo)
@@ -626,8 +624,6 @@ class CopickTool(ToolInstance):
         if not isinstance(item, TableMesh):
             return
 
-        print(self.mesh_map)
-        print(item.entity)
         if item.entity in self.mesh_map:
             surf = self.mesh_map[item.entity]
             surf.display = not surf.display
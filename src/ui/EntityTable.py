@@ -2,16 +2,29 @@ from typing import Callable, Tuple, Type, Union
 
 from copick.models import CopickMesh, CopickPicks, CopickRun, CopickSegmentation
 
+from .tree import sync_children
+
 
 class TableEntity:
     CopickClass = None
 
-    def __init__(self, entity: CopickClass, parent: "EntityTableRoot"):
+    def __init__(self, entity: CopickClass, parent: "EntityTableRoot", row: int):
         self.entity = entity
         self.parent = parent
+        self.row = row
         self.is_active = False
         self.has_children = False
 
+        # Qt asks for these on every repaint, entities don't change them after creation
+        if isinstance(entity, (CopickPicks, CopickMesh)):
+            name = entity.pickable_object_name
+        elif isinstance(entity, CopickSegmentation):
+            name = entity.name
+        else:
+            name = None
+        self._cells = (entity.user_id, name)
+        self._color = tuple(entity.color)
+
     def child(self, row) -> None:
         return None
 
@@ -19,19 +32,14 @@ class TableEntity:
         return 0
 
     def childIndex(self) -> Union[int, None]:
-        return self.parent.get_entity().index(self.entity)
+        return self.row
 
     def data(self, column: int) -> str:
-        if column == 0:
-            return self.entity.user_id
-        elif column == 1:
-            if isinstance(self.entity, (CopickPicks, CopickMesh)):
-                return self.entity.pickable_object_name
-            elif isinstance(self.entity, CopickSegmentation):
-                return self.entity.name
+        if 0 <= column < 2:
+            return self._cells[column]
 
     def color(self) -> Tuple[int, ...]:
-        return tuple(self.entity.color)
+        return self._color
 
     def columnCount(self) -> int:
         return 2
@@ -53,6 +61,7 @@ class EntityTableRoot:
     def __init__(self, run: CopickRun, get_entity: Callable, entity_clz: Type[TableEntity]):
         self.run = run
         self._children = None
+        self._by_entity = {}
         self.parent = None
         self.get_entity = get_entity
         self.is_active = False
@@ -60,11 +69,12 @@ class EntityTableRoot:
 
     @property
     def children(self):
-        if self._children is None:
-            self._children = [self.entity_clz(pick, self) for pick in self.get_entity()]
+        entities = self.get_entity()
 
-        if len(self._children) != len(self.get_entity()):
-            self._children = [self.entity_clz(pick, self) for pick in self.get_entity()]
+        if self._children is None or len(self._children) != len(entities):
+            # Keep the wrappers (and their active state) of entities that are still listed
+            self._children = sync_children(self, self._children, entities, self.entity_clz, lambda child: child.entity)
+            self._by_entity = {id(child.entity): child for child in self._children}
 
         return self._children
 
@@ -87,7 +97,6 @@ class EntityTableRoot:
         return 2
 
     def get_item(self, entity: Union[CopickPicks, CopickMesh, CopickSegmentation]) -> Union[None, TableEntity]:
-        for child in self.children:
-            if child.entity == entity:
-                return child
-        return None
+        # Refreshes the index if entities were added or removed since the last query
+        _ = self.children
+        return self._by_entity.get(id(entity))
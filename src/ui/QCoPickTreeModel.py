@@ -6,6 +6,9 @@ from qtpy.QtWidgets import QApplication, QFileIconProvider, QStyle
 
 from .tree import TreeRoot, TreeRun, TreeTomogram, TreeVoxelSpacing
 
+# Node types whose children are only listed once the view asks for them via fetchMore
+_LAZY_TYPES = (TreeRun, TreeVoxelSpacing)
+
 
 class QCoPickTreeModel(QAbstractItemModel):
     def __init__(
@@ -16,6 +19,11 @@ class QCoPickTreeModel(QAbstractItemModel):
         super().__init__(parent)
         self._root = TreeRoot(root=root_item)
         self._icon_provider = QFileIconProvider()
+        self._icon_folder = self._icon_provider.icon(QFileIconProvider.IconType.Folder)
+        self._icon_file = self._icon_provider.icon(QFileIconProvider.IconType.File)
+        self._icon_active = QApplication.instance().style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
+        self._fetched = set()
+        """Runs and voxel spacings whose children have been handed to the view via fetchMore."""
 
     def index(self, row: int, column: int, parent=QModelIndex()) -> Union[QModelIndex, None]:
         if not self.hasIndex(row, column, parent):
@@ -47,8 +55,32 @@ class QCoPickTreeModel(QAbstractItemModel):
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         parentItem = self._root if not parent.isValid() else parent.internalPointer()
 
+        if isinstance(parentItem, _LAZY_TYPES) and parentItem not in self._fetched:
+            return 0
+
         return parentItem.childCount()
 
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid():
+            return False
+
+        item = parent.internalPointer()
+        return isinstance(item, _LAZY_TYPES) and item not in self._fetched
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        item = parent.internalPointer()
+        count = item.childCount()
+
+        if count > 0:
+            self.beginInsertRows(parent, 0, count - 1)
+            self._fetched.add(item)
+            self.endInsertRows()
+        else:
+            self._fetched.add(item)
+
     def columnCount(self, parent: QModelIndex = QModelIndex()):
         return self._root.columnCount()
 
@@ -63,15 +95,12 @@ class QCoPickTreeModel(QAbstractItemModel):
 
         if role == 1 and index.column() == 0:
             if isinstance(item, (TreeRoot, TreeRun, TreeVoxelSpacing)):
-                return self._icon_provider.icon(QFileIconProvider.IconType.Folder)
+                return self._icon_folder
             elif isinstance(item, TreeTomogram):
                 if item.is_active:
-                    app = QApplication.instance()
-
-                    icon = app.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
-                    return icon
+                    return self._icon_active
                 else:
-                    return self._icon_provider.icon(QFileIconProvider.IconType.File)
+                    return self._icon_file
         else:
             return None
 
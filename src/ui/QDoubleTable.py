@@ -66,7 +66,6 @@ class QDoubleTable(QWidget):
 
     def _take_item(self) -> None:
         indexes = self._tool_table.selectedIndexes()
-        print(indexes)
 
         if len(indexes) < 1:
             self.takeClicked.emit(QModelIndex())
@@ -1,8 +1,8 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from chimerax.core.tools import ToolInstance
 from copick.impl.filesystem import CopickRootFSSpec
-from copick.models import CopickMesh, CopickPicks, CopickSegmentation
+from copick.models import CopickMesh, CopickPicks, CopickRun, CopickSegmentation
 from Qt.QtCore import QObject
 from Qt.QtWidgets import (
     QSizePolicy,
@@ -16,6 +16,13 @@ from ..ui.QCoPickTreeModel import QCoPickTreeModel
 from ..ui.step_widget import StepWidget
 from .QDoubleTable import QDoubleTable
 
+# Item type and tab label, in tab order
+_TABLE_TABS = (
+    ("picks", "Picks"),
+    ("meshes", "Meshes"),
+    ("segmentations", "Segmentations"),
+)
+
 
 class MainWidget(QWidget):
     def __init__(
@@ -28,6 +35,17 @@ class MainWidget(QWidget):
         self._copick = copick
         self._root = None
         self._model = None
+        self._run = None
+
+        # Item type -> table, meshes and segmentations are only built once their tab is first shown
+        self._tables: Dict[str, Optional[QDoubleTable]] = {item_type: None for item_type, _ in _TABLE_TABS}
+
+        # Item type -> CopickTool slot for double clicks on its table
+        self._show_slots = {
+            "picks": copick.show_particles,
+            "meshes": copick.show_mesh,
+            "segmentations": copick.show_segmentation,
+        }
 
         self._build()
         self._connect()
@@ -37,45 +55,26 @@ class MainWidget(QWidget):
         self._layout = QVBoxLayout()
         self.setLayout(self._layout)
 
+        # One tab page per entity type, tables are filled in by _build_table
+        self._object_tabs = QTabWidget()
+        self._tab_layouts = []
+        for _, label in _TABLE_TABS:
+            tab_layout = QVBoxLayout()
+            tab_widget = QWidget()
+            tab_widget.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
+            tab_widget.setLayout(tab_layout)
+            self._object_tabs.addTab(tab_widget, label)
+            self._tab_layouts.append(tab_layout)
+
         # Picks widget
-        picks_layout = QVBoxLayout()
-        picks_widget = QWidget()
-        picks_widget.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
-        self._picks_table = QDoubleTable("picks")
+        self._picks_table = self._build_table(0)
         self._picks_stepper = StepWidget(0, 0)
-        self._picks_table.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
         self._picks_stepper.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
-        picks_layout.addWidget(self._picks_table)
-        picks_layout.addWidget(self._picks_stepper)
-        picks_widget.setLayout(picks_layout)
-
-        # Mesh widget
-        meshes_layout = QVBoxLayout()
-        meshes_widget = QWidget()
-        meshes_widget.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
-        self._meshes_table = QDoubleTable("meshes")
-        self._meshes_table.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
-        meshes_layout.addWidget(self._meshes_table)
-        meshes_widget.setLayout(meshes_layout)
-
-        # Segmentation widget
-        segmentations_layout = QVBoxLayout()
-        segmentations_widget = QWidget()
-        segmentations_widget.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
-        self._segmentations_table = QDoubleTable("segmentations")
-        self._segmentations_table.setSizePolicy(
-            QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum),
-        )
-        segmentations_layout.addWidget(self._segmentations_table)
-        segmentations_widget.setLayout(segmentations_layout)
-
-        self._object_tabs = QTabWidget()
-        self._object_tabs.addTab(picks_widget, "Picks")
-        self._object_tabs.addTab(meshes_widget, "Meshes")
-        self._object_tabs.addTab(segmentations_widget, "Segmentations")
+        self._tab_layouts[0].addWidget(self._picks_stepper)
 
         # Tree View
         self._tree_view = QTreeView(parent=self)
+        self._tree_view.setUniformRowHeights(True)
         # self._tree_view.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
 
         # Main layout
@@ -83,38 +82,68 @@ class MainWidget(QWidget):
         self._layout.addWidget(self._object_tabs)
         self._layout.addWidget(self._tree_view)
 
+    def _build_table(self, index: int) -> QDoubleTable:
+        item_type, _ = _TABLE_TABS[index]
+
+        table = QDoubleTable(item_type)
+        table.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
+        self._tab_layouts[index].addWidget(table)
+        self._tables[item_type] = table
+
+        show = self._show_slots[item_type]
+        table._tool_table.doubleClicked.connect(show)
+        table._user_table.doubleClicked.connect(show)
+
+        if self._run is not None:
+            table.set_view(self._run)
+
+        return table
+
+    def _on_tab_changed(self, index: int):
+        if not 0 <= index < len(_TABLE_TABS):
+            return
+
+        if self._tables[_TABLE_TABS[index][0]] is None:
+            self._build_table(index)
+
     def set_root(self, root: CopickRootFSSpec):
         self._model = QCoPickTreeModel(root)
         self._tree_view.setModel(self._model)
 
+    def set_view(self, run: CopickRun):
+        self._run = run
+
+        for table in self._tables.values():
+            if table is not None:
+                table.set_view(run)
+
     def _connect(self):
         # Tree actions
         self._tree_view.doubleClicked.connect(self._copick.switch_volume)
 
-        # Picks actions
-        self._picks_table._tool_table.doubleClicked.connect(self._copick.show_particles)
-        self._picks_table._user_table.doubleClicked.connect(self._copick.show_particles)
+        # Picks actions (double clicks are connected in _build_table)
         self._picks_table._user_table.clicked.connect(self._copick.activate_particles)
         self._picks_table._tool_table.clicked.connect(self._copick.activate_particles)
         self._picks_table.takeClicked.connect(self._copick.take_particles)
 
-        # Meshes actions
-        self._meshes_table._tool_table.doubleClicked.connect(self._copick.show_mesh)
-        self._meshes_table._user_table.doubleClicked.connect(self._copick.show_mesh)
-
-        # Segmentations actions
-        self._segmentations_table._tool_table.doubleClicked.connect(self._copick.show_segmentation)
-        self._segmentations_table._user_table.doubleClicked.connect(self._copick.show_segmentation)
+        # Meshes and segmentations actions are connected when their tables are built
+        self._object_tabs.currentChanged.connect(self._on_tab_changed)
 
         self._picks_stepper.stateChanged.connect(self._copick._set_active_particle)
 
     def set_entity_active(self, picks: Union[CopickMesh, CopickPicks, CopickSegmentation], active: bool):
         if isinstance(picks, CopickPicks):
-            self._picks_table.set_entity_active(picks, active)
+            item_type = "picks"
         elif isinstance(picks, CopickMesh):
-            self._meshes_table.set_entity_active(picks, active)
+            item_type = "meshes"
         elif isinstance(picks, CopickSegmentation):
-            self._segmentations_table.set_entity_active(picks, active)
+            item_type = "segmentations"
+        else:
+            return
+
+        table = self._tables[item_type]
+        if table is not None:
+            table.set_entity_active(picks, active)
 
     def update_picks_table(self):
         self._picks_table.update()
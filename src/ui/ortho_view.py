@@ -24,6 +24,9 @@ class OrthoViewCanvas(QWindow):
         QWindow.destroy(self)
 
     def _redraw(self, *_):
+        # Skip the shared context switch while the panel is hidden
+        if not self.isExposed():
+            return
         self.render()
 
     def exposeEvent(self, event):  # noqa
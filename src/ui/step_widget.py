@@ -1,3 +1,5 @@
+from Qt.QtCore import QEvent, QLocale
+from Qt.QtGui import QIntValidator
 from Qt.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -29,6 +31,13 @@ class StepWidget(QWidget):
         self._text = QLineEdit("0")
         self._text.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
         self._text.setMaximumWidth(60)
+        # C locale without group separators, so accepted text is always a plain integer
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+        self._validator = QIntValidator(self._min, self._max, self)
+        self._validator.setLocale(locale)
+        self._text.setValidator(self._validator)
+        self._text.installEventFilter(self)
 
         self._label = QLabel(f"of {self._state}")
         self._label.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum))
@@ -64,6 +73,13 @@ class StepWidget(QWidget):
     def _txt(self):
         self.state = max(self._min, min(self._max, int(self._text.text())))
 
+    def eventFilter(self, obj, event):  # noqa
+        # editingFinished is not emitted for unacceptable (e.g. empty) text, show the current state again
+        if obj is self._text and event.type() == QEvent.Type.FocusOut and not self._text.hasAcceptableInput():
+            self._text.setText(str(self._state))
+
+        return super().eventFilter(obj, event)
+
     def _update(self):
         self._text.setText(str(self._state))
         self._label.setText(f"of {self._max}")
@@ -72,5 +88,6 @@ class StepWidget(QWidget):
     def set(self, max: int, state: int = 0):
         self._max = max
         self._state = state
+        self._validator.setTop(self._max)
         self._text.setText(str(self._state))
         self._label.setText(f"of {self._max}")
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, Union
 
 from copick.models import (
     CopickRoot,
@@ -8,7 +8,25 @@ from copick.models import (
 )
 
 
+def sync_children(parent, children: Union[list, None], items: list, clz: type, item_of: Callable) -> list:
+    """Wrap items as clz children of parent, reusing the wrappers in children whose item_of(child) is still listed."""
+    existing = {id(item_of(child)): child for child in children or ()}
+    synced = []
+
+    for row, item in enumerate(items):
+        child = existing.get(id(item))
+        if child is None:
+            child = clz(item, parent, row)
+        else:
+            child.row = row
+        synced.append(child)
+
+    return synced
+
+
 class TreeRoot:
+    __slots__ = ("root", "parent", "_children", "has_children")
+
     def __init__(self, root: CopickRoot):
         self.root = root
         self.parent = None
@@ -17,11 +35,10 @@ class TreeRoot:
 
     @property
     def children(self):
-        if self._children is None:
-            self._children = [TreeRun(run, self) for run in self.root.runs]
+        runs = self.root.runs
 
-        if len(self._children) != len(self.root.runs):
-            self._children = [TreeRun(run, self) for run in self.root.runs]
+        if self._children is None or len(self._children) != len(runs):
+            self._children = sync_children(self, self._children, runs, TreeRun, lambda child: child.run)
 
         return self._children
 
@@ -45,19 +62,23 @@ class TreeRoot:
 
 
 class TreeRun:
-    def __init__(self, run: CopickRun, parent: TreeRoot):
+    __slots__ = ("run", "parent", "row", "_children", "has_children")
+
+    def __init__(self, run: CopickRun, parent: TreeRoot, row: int):
         self.run = run
         self.parent = parent
+        self.row = row
         self._children = None
         self.has_children = True
 
     @property
     def children(self):
-        if self._children is None:
-            self._children = [TreeVoxelSpacing(voxel_spacing, self) for voxel_spacing in self.run.voxel_spacings]
+        voxel_spacings = self.run.voxel_spacings
 
-        if len(self._children) != len(self.run.voxel_spacings):
-            self._children = [TreeVoxelSpacing(voxel_spacing, self) for voxel_spacing in self.run.voxel_spacings]
+        if self._children is None or len(self._children) != len(voxel_spacings):
+            self._children = sync_children(
+                self, self._children, voxel_spacings, TreeVoxelSpacing, lambda child: child.voxel_spacing
+            )
 
         return self._children
 
@@ -68,7 +89,7 @@ class TreeRun:
         return len(self.children)  # 0  # len(self.run.voxel_spacings)
 
     def childIndex(self) -> Union[int, None]:
-        return self.run.root.runs.index(self.run)
+        return self.row
 
     def data(self, column: int) -> str:
         if column == 0:
@@ -81,19 +102,21 @@ class TreeRun:
 
 
 class TreeVoxelSpacing:
-    def __init__(self, voxel_spacing: CopickVoxelSpacing, parent: TreeRun):
+    __slots__ = ("voxel_spacing", "parent", "row", "_children", "has_children")
+
+    def __init__(self, voxel_spacing: CopickVoxelSpacing, parent: TreeRun, row: int):
         self.voxel_spacing = voxel_spacing
         self.parent = parent
+        self.row = row
         self._children = None
         self.has_children = True
 
     @property
     def children(self):
-        if self._children is None:
-            self._children = [TreeTomogram(tomogram, self) for tomogram in self.voxel_spacing.tomograms]
+        tomograms = self.voxel_spacing.tomograms
 
-        if len(self._children) != len(self.voxel_spacing.tomograms):
-            self._children = [TreeTomogram(tomogram, self) for tomogram in self.voxel_spacing.tomograms]
+        if self._children is None or len(self._children) != len(tomograms):
+            self._children = sync_children(self, self._children, tomograms, TreeTomogram, lambda child: child.tomogram)
 
         return self._children
 
@@ -104,7 +127,7 @@ class TreeVoxelSpacing:
         return len(self.children)
 
     def childIndex(self) -> Union[int, None]:
-        return self.voxel_spacing.run.voxel_spacings.index(self.voxel_spacing)
+        return self.row
 
     def data(self, column: int) -> str:
         if column == 0:
@@ -117,9 +140,12 @@ class TreeVoxelSpacing:
 
 
 class TreeTomogram:
-    def __init__(self, tomogram: CopickTomogram, parent: TreeVoxelSpacing):
+    __slots__ = ("tomogram", "parent", "row", "is_active", "has_children")
+
+    def __init__(self, tomogram: CopickTomogram, parent: TreeVoxelSpacing, row: int):
         self.tomogram = tomogram
         self.parent = parent
+        self.row = row
         self.is_active = False
         self.has_children = False
 
@@ -130,7 +156,7 @@ class TreeTomogram:
         return 0
 
     def childIndex(self) -> Union[int, None]:
-        return self.tomogram.voxel_spacing.tomograms.index(self.tomogram)
+        return self.row
 
     def data(self, column: int) -> str:
         if column == 0: